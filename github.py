@@ -1,11 +1,91 @@
 import asyncio
 import os
+import random
 import shutil
+import tempfile
+import time
 
 import httpx
+import orjson
 from rich.console import Console
 from rich.prompt import Confirm
 
+# GraphQL query for the viewer's repositories, selecting only the fields we use.
+# The affiliations match the REST /user/repos default (owner, collaborator, organization member).
+REPOSITORIES_QUERY = """
+query($cursor: String) {
+  viewer {
+    repositories(
+      first: 100
+      after: $cursor
+      affiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER]
+      ownerAffiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER]
+    ) {
+      pageInfo { endCursor hasNextPage }
+      nodes { name url isPrivate owner { login } stargazerCount forkCount }
+    }
+  }
+}
+"""
+
+# Upper bound on in-flight DELETE requests, to stay clear of GitHub's secondary rate limits
+MAX_CONCURRENT_DELETES = 10
+
+# How long (in seconds) a cached response is served without refetching or revalidation
+CACHE_TTL = 60.0
+
+# Git options for the transfer commands. protocol.version=2 only affects the clone
+# (the push always uses protocol v0), and pack.threads=0 only affects the pack the
+# push builds. Recent git already defaults to both; they are pinned for older installs.
+GIT_CONFIG_ARGS = ["-c", "protocol.version=2", "-c", "pack.threads=0"]
+
+# Rate-limit retry policy: number of attempts and the longest wait worth sleeping through
+MAX_RETRIES = 5
+MAX_RETRY_WAIT = 60.0
+
+
+class RateLimitRetryTransport(httpx.AsyncHTTPTransport):
+    """
+    HTTP transport that retries requests rejected by GitHub's rate limits.
+
+    A 429, or a 403 carrying Retry-After or an exhausted X-RateLimit-Remaining,
+    is retried up to MAX_RETRIES times. The wait honours Retry-After, then
+    X-RateLimit-Reset, and falls back to exponential backoff; jitter is added so
+    concurrent requests do not retry in lockstep. Waits longer than
+    MAX_RETRY_WAIT are not slept through and the response is returned as is.
+    """
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(MAX_RETRIES + 1):
+            response = await super().handle_async_request(request)
+            if attempt == MAX_RETRIES:
+                return response
+            delay = self._retry_delay(response, attempt)
+            if delay is None or delay > MAX_RETRY_WAIT:
+                return response
+            await response.aclose()
+            await asyncio.sleep(delay + random.random())
+        return response
+
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float | None:
+        """Return how long to wait before retrying, or None if the response is final."""
+        headers = response.headers
+        rate_limited = response.status_code == 429 or (
+            response.status_code == 403
+            and ("retry-after" in headers or headers.get("x-ratelimit-remaining") == "0")
+        )
+        if not rate_limited:
+            return None
+        try:
+            if "retry-after" in headers:
+                return float(headers["retry-after"])
+            if headers.get("x-ratelimit-remaining") == "0" and "x-ratelimit-reset" in headers:
+                return max(float(headers["x-ratelimit-reset"]) - time.time(), 0.0)
+        except ValueError:
+            pass
+        return float(2**attempt)
+
 
 class GitHubAssistant:
     """
@@ -25,22 +105,147 @@ class GitHubAssistant:
 
     def __init__(self, username: str, token: str):
         self.username = username
+        # Case-folded login, computed once for owner comparisons
+        self._username_lc = username.lower()
         self.token = token
         self.base_url = "https://api.github.com"
         self.console = Console()
-        # Create a shared asynchronous HTTP client with authorization headers
+        # Create a shared asynchronous HTTP/2 client with authorization headers;
+        # concurrent requests are multiplexed over the pooled connection, and the
+        # retry transport transparently waits out rate-limit responses
         self.client = httpx.AsyncClient(
+            transport=RateLimitRetryTransport(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            ),
             timeout=30.0,
+            base_url=self.base_url,
             headers={
                 "Authorization": f"token {self.token}",
                 "Accept": "application/vnd.github.v3+json",
             },
         )
+        # Response cache for GET requests: url -> (fetched at, ETag, response, parsed JSON)
+        self._cache: dict[str, tuple[float, str, httpx.Response, object]] = {}
+        # Repository nodes from the last GraphQL listing: (fetched at, nodes)
+        self._repos_cache: tuple[float, list] | None = None
+        # Background task loading the repository listing ahead of the next request
+        self._prefetch_task: asyncio.Task | None = None
 
     async def close(self):
-        """Close the HTTP client."""
+        """Cancel any pending prefetch and close the HTTP client."""
+        if self._prefetch_task is not None:
+            self._prefetch_task.cancel()
+            await asyncio.gather(self._prefetch_task, return_exceptions=True)
         await self.client.aclose()
 
+    async def _cached_get(self, url: str) -> tuple[httpx.Response, object]:
+        """
+        GET a JSON resource through the in-memory response cache.
+
+        Fresh entries (younger than CACHE_TTL) are returned without a request.
+        Stale entries are revalidated with If-None-Match; a 304 reply costs no
+        rate limit and keeps the cached data. Returns the response together with
+        its parsed JSON, or None as the data when the request failed.
+        """
+        now = time.monotonic()
+        cached = self._cache.get(url)
+        if cached is None:
+            response = await self.client.get(url)
+        else:
+            fetched_at, etag, cached_response, data = cached
+            if now - fetched_at < CACHE_TTL:
+                return cached_response, data
+            response = await self.client.get(url, headers={"If-None-Match": etag})
+            if response.status_code == 304:
+                self._cache[url] = (now, etag, cached_response, data)
+                return cached_response, data
+        if response.status_code != 200:
+            return response, None
+        data = orjson.loads(response.content)
+        etag = response.headers.get("ETag")
+        if etag:
+            self._cache[url] = (now, etag, response, data)
+        return response, data
+
+    def invalidate_repos(self):
+        """Drop the cached repository listing after an operation that changes it."""
+        self._repos_cache = None
+        # A listing still in flight may predate the change
+        if self._prefetch_task is not None and not self._prefetch_task.done():
+            self._prefetch_task.cancel()
+        self._prefetch_task = None
+
+    def prefetch_repositories(self):
+        """
+        Start loading the repository listing in the background, unless a fresh copy
+        is cached or a load is already in flight. The next get_repositories call
+        picks up the result instead of issuing its own requests.
+        """
+        if self._repos_cache is not None and (
+            time.monotonic() - self._repos_cache[0] < CACHE_TTL
+        ):
+            return
+        if self._prefetch_task is not None and not self._prefetch_task.done():
+            return
+        self._discard_finished_prefetch()
+        self._prefetch_task = asyncio.create_task(self._load_repositories())
+
+    def _discard_finished_prefetch(self):
+        """
+        Drop a finished prefetch task, reporting its exception if it failed, so the
+        error is not lost when the task is replaced.
+        """
+        task = self._prefetch_task
+        if task is None or not task.done():
+            return
+        self._prefetch_task = None
+        if not task.cancelled() and task.exception() is not None:
+            self.console.print(
+                f"[red]Background repository fetch failed: {task.exception()!r}[/red]"
+            )
+
+    async def _load_repositories(self) -> tuple[httpx.Response, list | None]:
+        """Fetch the repository listing and store it in the cache on success."""
+        response, repos = await self._fetch_repository_nodes()
+        if repos is not None:
+            self._repos_cache = (time.monotonic(), repos)
+        return response, repos
+
+    async def _fetch_repository_nodes(
+        self, headers: dict | None = None
+    ) -> tuple[httpx.Response, list | None]:
+        """
+        Page through viewer.repositories with the GraphQL API.
+
+        Pass headers to authenticate as another account. Returns the last response
+        together with the collected repository nodes, or None as the nodes when a
+        request failed or returned no listing.
+        """
+        nodes = []
+        cursor = None
+        while True:
+            response = await self.client.post(
+                "/graphql",
+                headers=headers,
+                json={"query": REPOSITORIES_QUERY, "variables": {"cursor": cursor}},
+            )
+            if response.status_code != 200:
+                return response, None
+            payload = orjson.loads(response.content)
+            # GitHub may answer with partial data plus errors (e.g. SAML-protected
+            # organization repositories come back as null nodes); only a missing
+            # listing is fatal, the inaccessible entries are skipped like REST did
+            viewer = (payload.get("data") or {}).get("viewer") or {}
+            repositories = viewer.get("repositories")
+            if repositories is None:
+                return response, None
+            nodes.extend(node for node in repositories["nodes"] if node)
+            page_info = repositories["pageInfo"]
+            if not page_info["hasNextPage"]:
+                return response, nodes
+            cursor = page_info["endCursor"]
+
     async def get_repositories(self, repo_filter: str = "owner") -> list:
         """
         Fetch a list of repositories for the current account with optional filtering.
@@ -53,39 +258,50 @@ class GitHubAssistant:
         Returns a list of dictionaries with keys:
             name, html_url, visibility, repo_type, owner, stargazers_count, forks_count.
         """
-        url = f"{self.base_url}/user/repos?per_page=100"
-        response = await self.client.get(url)
-        if response.status_code != 200:
-            self.console.print(
-                f"[red]Error fetching repositories: {response.text}[/red]"
-            )
-            return []
-        repos = response.json()
+        now = time.monotonic()
+        if self._repos_cache is not None and now - self._repos_cache[0] < CACHE_TTL:
+            repos = self._repos_cache[1]
+        else:
+            # Reuse a prefetch that is still in flight; a finished one has already
+            # filled the cache, so reaching this point means it is stale or failed
+            self._discard_finished_prefetch()
+            task = self._prefetch_task
+            if task is not None:
+                response, repos = await task
+            else:
+                response, repos = await self._load_repositories()
+            if repos is None:
+                self.console.print(
+                    f"[red]Error fetching repositories: {response.text}[/red]"
+                )
+                return []
+
+        username_lc = self._username_lc
+        want_owner = repo_filter == "owner"
+        want_collaborator = repo_filter == "collaborator"
         result = []
+        append = result.append
         for repo in repos:
             # Determine repository type: "owner" if your login matches the repository owner,
             # otherwise consider it as "collaborator"
-            repo_type = (
-                "owner"
-                if repo["owner"]["login"].lower() == self.username.lower()
-                else "collaborator"
-            )
-            visibility = "Private" if repo["private"] else "Public"
-            repo_info = {
-                "name": repo["name"],
-                "html_url": repo.get("html_url", ""),
-                "visibility": visibility,
-                "repo_type": repo_type,
-                "owner": repo["owner"]["login"],
-                "stargazers_count": repo.get("stargazers_count", 0),
-                "forks_count": repo.get("forks_count", 0),
-            }
-            # Apply filtering based on the repo_filter parameter
-            if repo_filter == "owner" and repo_type != "owner":
+            owner_login = repo["owner"]["login"]
+            is_owner = owner_login.lower() == username_lc
+            # Apply filtering based on the repo_filter parameter before building the entry
+            if want_owner and not is_owner:
                 continue
-            elif repo_filter == "collaborator" and repo_type != "collaborator":
+            if want_collaborator and is_owner:
                 continue
-            result.append(repo_info)
+            append(
+                {
+                    "name": repo["name"],
+                    "html_url": repo["url"],
+                    "visibility": "Private" if repo["isPrivate"] else "Public",
+                    "repo_type": "owner" if is_owner else "collaborator",
+                    "owner": owner_login,
+                    "stargazers_count": repo["stargazerCount"],
+                    "forks_count": repo["forkCount"],
+                }
+            )
         return result
 
     async def delete_repository(self, repo_name: str) -> bool:
@@ -98,18 +314,24 @@ class GitHubAssistant:
         ):
             self.console.print("[yellow]Deletion cancelled.[/yellow]")
             return False
-        url = f"{self.base_url}/repos/{self.username}/{repo_name}"
+        deleted, message = await self._delete_repo_http(repo_name)
+        self.console.print(message)
+        return deleted
+
+    async def _delete_repo_http(self, repo_name: str) -> tuple[bool, str]:
+        """
+        Send the DELETE request for a repository you own, without asking for confirmation.
+        Returns whether the deletion succeeded together with a printable status message.
+        """
+        url = f"/repos/{self.username}/{repo_name}"
         response = await self.client.delete(url)
         if response.status_code == 204:
-            self.console.print(
-                f"[green]Repository '{repo_name}' successfully deleted.[/green]"
-            )
-            return True
-        else:
-            self.console.print(
-                f"[red]Error deleting repository '{repo_name}': {response.text}[/red]"
-            )
-            return False
+            self.invalidate_repos()
+            return True, f"[green]Repository '{repo_name}' successfully deleted.[/green]"
+        return (
+            False,
+            f"[red]Error deleting repository '{repo_name}': {response.text}[/red]",
+        )
 
     async def leave_repository(self, repo: dict) -> bool:
         """
@@ -121,9 +343,10 @@ class GitHubAssistant:
         ):
             self.console.print("[yellow]Operation cancelled.[/yellow]")
             return False
-        url = f"{self.base_url}/repos/{repo['owner']}/{repo['name']}/collaborators/{self.username}"
+        url = f"/repos/{repo['owner']}/{repo['name']}/collaborators/{self.username}"
         response = await self.client.delete(url)
         if response.status_code == 204:
+            self.invalidate_repos()
             self.console.print(
                 f"[green]You have successfully left the repository '{repo['name']}'.[/green]"
             )
@@ -144,7 +367,7 @@ class GitHubAssistant:
           1. Confirm transfer.
           2. Create repository on the new account.
           3. Clone the repository locally in mirror mode.
-          4. Change the remote URL and push mirror to the new repository.
+          4. Push mirror directly to the new repository's URL.
           5. Delete the local copy.
           6. Optionally delete the repository from the old account.
         """
@@ -155,83 +378,77 @@ class GitHubAssistant:
             return False
 
         # Create repository on the new account
-        create_url = "https://api.github.com/user/repos"
-        headers_new = {
-            "Authorization": f"token {new_token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
+        create_url = "/user/repos"
         create_data = {"name": repo_name, "private": True}
-        async with httpx.AsyncClient(headers=headers_new, timeout=30.0) as new_client:
-            create_response = await new_client.post(create_url, json=create_data)
-            if create_response.status_code == 201:
-                self.console.print(
-                    f"[green]Repository '{repo_name}' created on account '{new_owner}'.[/green]"
-                )
-            else:
-                self.console.print(
-                    f"[red]Error creating repository on the new account: {create_response.text}[/red]"
-                )
-                return False
+        # Reuse the pooled client; per-request headers override the default token
+        create_response = await self.client.post(
+            create_url,
+            headers={"Authorization": f"token {new_token}"},
+            json=create_data,
+        )
+        if create_response.status_code == 201:
+            self.console.print(
+                f"[green]Repository '{repo_name}' created on account '{new_owner}'.[/green]"
+            )
+        else:
+            self.console.print(
+                f"[red]Error creating repository on the new account: {create_response.text}[/red]"
+            )
+            return False
 
         # Clone the repository using mirror clone
         self.console.print(f"[blue]Cloning repository '{repo_name}'...[/blue]")
         clone_url = f"https://{self.token}@github.com/{self.username}/{repo_name}.git"
-        clone_cmd = ["git", "clone", "--mirror", clone_url]
-        clone_process = await asyncio.create_subprocess_exec(
-            *clone_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await clone_process.communicate()
-        if clone_process.returncode != 0:
-            self.console.print(
-                f"[red]Error cloning repository '{repo_name}': {stderr.decode().strip()}[/red]"
+        # Stage the bare mirror in a scratch directory; the finally block removes it
+        # on every exit path, since the mirror's config holds the token in its URL
+        work_dir = tempfile.mkdtemp(prefix="get-git-")
+        repo_dir = os.path.join(work_dir, f"{repo_name}.git")
+        git_process = None
+        try:
+            clone_cmd = ["git", *GIT_CONFIG_ARGS, "clone", "--mirror", clone_url, repo_dir]
+            git_process = await asyncio.create_subprocess_exec(
+                *clone_cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-            return False
+            stdout, stderr = await git_process.communicate()
+            if git_process.returncode != 0:
+                self.console.print(
+                    f"[red]Error cloning repository '{repo_name}': {stderr.decode().strip()}[/red]"
+                )
+                return False
 
-        repo_dir = f"{repo_name}.git"
-        if not os.path.exists(repo_dir):
-            self.console.print(f"[red]Local directory '{repo_dir}' not found.[/red]")
-            return False
+            if not os.path.exists(repo_dir):
+                self.console.print(f"[red]Local directory '{repo_dir}' not found.[/red]")
+                return False
 
-        # Push mirror to the new repository
-        self.console.print(
-            f"[blue]Pushing repository '{repo_name}' to the new account...[/blue]"
-        )
-        old_cwd = os.getcwd()
-        os.chdir(repo_dir)
-        new_remote_url = f"https://{new_token}@github.com/{new_owner}/{repo_name}.git"
-        set_remote_cmd = ["git", "remote", "set-url", "origin", new_remote_url]
-        set_remote_process = await asyncio.create_subprocess_exec(
-            *set_remote_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await set_remote_process.communicate()
-        if set_remote_process.returncode != 0:
+            # Push mirror to the new repository
             self.console.print(
-                f"[red]Error setting new remote for '{repo_name}': {stderr.decode().strip()}[/red]"
+                f"[blue]Pushing repository '{repo_name}' to the new account...[/blue]"
             )
-            os.chdir(old_cwd)
-            return False
-
-        push_cmd = ["git", "push", "--mirror", "origin"]
-        push_process = await asyncio.create_subprocess_exec(
-            *push_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await push_process.communicate()
-        os.chdir(old_cwd)
-        if push_process.returncode != 0:
-            self.console.print(
-                f"[red]Error pushing repository '{repo_name}' to the new account: {stderr.decode().strip()}[/red]"
+            new_remote_url = f"https://{new_token}@github.com/{new_owner}/{repo_name}.git"
+            # Push straight to the new URL instead of rewriting the origin remote first
+            push_cmd = ["git", *GIT_CONFIG_ARGS, "push", "--mirror", new_remote_url]
+            git_process = await asyncio.create_subprocess_exec(
+                *push_cmd,
+                cwd=repo_dir,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-            return False
-
-        # Remove the local mirror copy
-        self.console.print(f"[blue]Removing local directory '{repo_dir}'...[/blue]")
-        shutil.rmtree(repo_dir, ignore_errors=True)
+            stdout, stderr = await git_process.communicate()
+            if git_process.returncode != 0:
+                self.console.print(
+                    f"[red]Error pushing repository '{repo_name}' to the new account: {stderr.decode().strip()}[/red]"
+                )
+                return False
+        finally:
+            # A cancelled or failed step may leave git running inside work_dir
+            if git_process is not None and git_process.returncode is None:
+                git_process.kill()
+                await git_process.wait()
+            # Remove the local mirror copy
+            self.console.print(f"[blue]Removing local directory '{repo_dir}'...[/blue]")
+            shutil.rmtree(work_dir, ignore_errors=True)
 
         # Optionally delete the repository from the old account
         if delete_old:
@@ -251,31 +468,29 @@ class GitHubAssistant:
         Compare the current account's (owned only) repositories with another account's repositories.
         Returns a dictionary of duplicates, where the key is the repository name and the value is its visibility.
         """
-        my_repos = await self.get_repositories("owner")
-        headers_other = {
-            "Authorization": f"token {other_token}",
-            "Accept": "application/vnd.github.v3+json",
+        # Fetch both accounts' repositories concurrently; the other account's
+        # token is sent as a per-request header on the shared client
+        my_repos, (response, other_nodes) = await asyncio.gather(
+            self.get_repositories("owner"),
+            self._fetch_repository_nodes(
+                headers={"Authorization": f"token {other_token}"}
+            ),
+        )
+        if other_nodes is None:
+            self.console.print(
+                f"[red]Error fetching repositories for {other_username}: {response.text}[/red]"
+            )
+            return {}
+        other_username_lc = other_username.lower()
+        other_names = {
+            node["name"]
+            for node in other_nodes
+            if node["owner"]["login"].lower() == other_username_lc
         }
-        url = "https://api.github.com/user/repos?per_page=100"
-        async with httpx.AsyncClient(
-            headers=headers_other, timeout=30.0
-        ) as other_client:
-            response = await other_client.get(url)
-            if response.status_code != 200:
-                self.console.print(
-                    f"[red]Error fetching repositories for {other_username}: {response.text}[/red]"
-                )
-                return {}
-            other_repos_data = response.json()
-            other_repos = {
-                repo["name"]: ("Private" if repo["private"] else "Public")
-                for repo in other_repos_data
-                if repo["owner"]["login"].lower() == other_username.lower()
-            }
         duplicates = {
             repo["name"]: repo["visibility"]
             for repo in my_repos
-            if repo["name"] in other_repos
+            if repo["name"] in other_names
         }
         return duplicates
 
@@ -308,8 +523,17 @@ class GitHubAssistant:
         if not Confirm.ask("Delete these repositories from your account?"):
             self.console.print("[yellow]Deletion cancelled.[/yellow]")
             return
-        for repo in repos_to_delete:
-            await self.delete_repository(repo)
+        # The batch is already confirmed, so skip the per-repository prompt
+        # and run the deletions concurrently behind a semaphore
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DELETES)
+
+        async def delete_one(name: str) -> tuple[bool, str]:
+            async with semaphore:
+                return await self._delete_repo_http(name)
+
+        results = await asyncio.gather(*(delete_one(name) for name in repos_to_delete))
+        for _, message in results:
+            self.console.print(message)
         self.console.print("[green]Duplicate repositories deletion completed.[/green]")
 
     async def get_account_statistics(self) -> dict:
@@ -320,11 +544,12 @@ class GitHubAssistant:
           - Total stars and forks across all repositories
         """
         stats = {}
-        # Fetch user information
-        user_url = f"{self.base_url}/user"
-        response = await self.client.get(user_url)
-        if response.status_code == 200:
-            user_info = response.json()
+        # Fetch user information and repository details concurrently
+        user_url = "/user"
+        (response, user_info), repos_all = await asyncio.gather(
+            self._cached_get(user_url), self.get_repositories("all")
+        )
+        if user_info is not None:
             stats["Login"] = user_info.get("login")
             stats["Name"] = user_info.get("name")
             stats["Public Repos"] = user_info.get("public_repos", 0)
@@ -336,15 +561,18 @@ class GitHubAssistant:
                 f"[red]Error fetching user information: {response.text}[/red]"
             )
 
-        # Fetch repository details
-        repos_all = await self.get_repositories("all")
+        # Aggregate the repository counters in a single pass
+        owned = collaborated = total_stars = total_forks = 0
+        for r in repos_all:
+            if r["repo_type"] == "owner":
+                owned += 1
+            else:
+                collaborated += 1
+            total_stars += r["stargazers_count"]
+            total_forks += r["forks_count"]
         stats["Total Repos"] = len(repos_all)
-        stats["Owned Repos"] = len([r for r in repos_all if r["repo_type"] == "owner"])
-        stats["Collaborator Repos"] = len(
-            [r for r in repos_all if r["repo_type"] == "collaborator"]
-        )
-        total_stars = sum(r.get("stargazers_count", 0) for r in repos_all)
-        total_forks = sum(r.get("forks_count", 0) for r in repos_all)
+        stats["Owned Repos"] = owned
+        stats["Collaborator Repos"] = collaborated
         stats["Total Stars"] = total_stars
         stats["Total Forks"] = total_forks
         return stats
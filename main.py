@@ -1,12 +1,162 @@
 import asyncio
+import threading
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.table import Table
+from rich.text import Text
 
 from github import GitHubAssistant
 
+# Number of repositories rendered per table page
+PAGE_SIZE = 25
+
+
+def _repo_table(
+    title: str, repos: list, show_type: bool = True, start: int = 1
+) -> Table:
+    """
+    Build a repository table from precomputed rows.
+    Names and URLs are passed as plain Text, so Rich does not parse them as markup.
+    Row indices are numbered from start.
+    """
+    table = Table(title=title, show_lines=True)
+    # Short, fixed-vocabulary columns never need wrapping
+    table.add_column("Index", style="cyan", justify="right", no_wrap=True)
+    table.add_column("Name", style="green")
+    table.add_column("Visibility", style="magenta", no_wrap=True)
+    if show_type:
+        table.add_column("Type", style="yellow", no_wrap=True)
+    table.add_column("URL", style="blue", overflow="fold")
+    if show_type:
+        rows = [
+            (
+                str(idx),
+                Text(r["name"]),
+                r["visibility"],
+                r["repo_type"],
+                Text(r["html_url"]),
+            )
+            for idx, r in enumerate(repos, start=start)
+        ]
+    else:
+        rows = [
+            (str(idx), Text(r["name"]), r["visibility"], Text(r["html_url"]))
+            for idx, r in enumerate(repos, start=start)
+        ]
+    for row in rows:
+        table.add_row(*row)
+    return table
+
+
+def _browse_repos(
+    console: Console,
+    repos: list,
+    title: str,
+    show_type: bool = True,
+    index_prompt: str | None = None,
+) -> str | None:
+    """
+    Display repositories one page of PAGE_SIZE rows at a time, so only the visible
+    slice is laid out by Rich.
+
+    Without index_prompt the table is only browsed and None is returned.
+    With index_prompt the user's answer (expected to be an index) is returned,
+    or None if they quit.
+    """
+    pages = max((len(repos) + PAGE_SIZE - 1) // PAGE_SIZE, 1)
+    page = 0
+    while True:
+        start = page * PAGE_SIZE
+        page_title = title if pages == 1 else f"{title} (page {page + 1}/{pages})"
+        console.print(
+            _repo_table(
+                page_title, repos[start : start + PAGE_SIZE], show_type, start + 1
+            )
+        )
+        if pages == 1:
+            return Prompt.ask(index_prompt) if index_prompt else None
+        if index_prompt:
+            answer = Prompt.ask(f"{index_prompt} (n - next, p - previous, q - quit)")
+        else:
+            answer = Prompt.ask(
+                "n - next, p - previous, q - quit", choices=["n", "p", "q"]
+            )
+        answer = answer.strip().lower()
+        if answer == "n":
+            page = (page + 1) % pages
+        elif answer == "p":
+            page = (page - 1) % pages
+        elif answer == "q":
+            return None
+        else:
+            return answer
+
+
+def _pick_repo(
+    console: Console, repos: list, title: str, action: str, show_type: bool = True
+) -> dict | None:
+    """
+    Let the user pick a repository by its index from the paged table.
+    Returns the selected repository, or None if they quit or entered an invalid index.
+    """
+    repo_index = _browse_repos(
+        console,
+        repos,
+        title,
+        show_type=show_type,
+        index_prompt=f"Enter the index of the repository to {action}",
+    )
+    if repo_index is None:
+        return None
+    try:
+        position = int(repo_index)
+    except ValueError:
+        position = 0
+    # Indices start at 1; reject 0 and negatives instead of wrapping around the list
+    if not 1 <= position <= len(repos):
+        console.print("[red]Invalid index selected.[/red]")
+        return None
+    return repos[position - 1]
+
+
+async def _ask(*args, **kwargs) -> str:
+    """
+    Run Prompt.ask without blocking the event loop, so background work such as the
+    repository prefetch keeps running while the user types.
+
+    The prompt is read in a daemon thread that hands the answer back through a loop
+    future. Unlike asyncio.to_thread, nothing joins that thread on shutdown, so
+    Ctrl-C still exits while the thread is blocked in input().
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(result, error):
+        # The awaiting coroutine may have been cancelled in the meantime
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def read():
+        result, error = None, None
+        try:
+            result = Prompt.ask(*args, **kwargs)
+        except Exception as exc:
+            error = exc
+        try:
+            loop.call_soon_threadsafe(resolve, result, error)
+        except RuntimeError:
+            # The event loop is already closed
+            pass
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
 
 async def main():
     console = Console()
@@ -16,153 +166,131 @@ async def main():
 
     assistant = GitHubAssistant(username=username, token=token)
 
-    while True:
-        console.print("\n[bold]Menu:[/bold]")
-        console.print("1. View repositories")
-        console.print("2. Delete repository / Leave repository")
-        console.print("3. Transfer repository")
-        console.print("4. Delete duplicate repositories (compare with another account)")
-        console.print("5. Account statistics")
-        console.print("6. Exit")
-        choice = Prompt.ask("Choose an action", choices=["1", "2", "3", "4", "5", "6"])
-
-        if choice == "1":
-            # Select filter for viewing repositories
-            console.print("\n[bold]Repository viewing options:[/bold]")
-            console.print("1. All repositories (owned and collaborated)")
-            console.print("2. Only owned repositories")
-            console.print("3. Only collaborated repositories")
-            filter_choice = Prompt.ask("Choose an option", choices=["1", "2", "3"])
-            if filter_choice == "1":
-                repo_filter = "all"
-            elif filter_choice == "2":
-                repo_filter = "owner"
-            elif filter_choice == "3":
-                repo_filter = "collaborator"
-            repos = await assistant.get_repositories(repo_filter)
-            if not repos:
-                console.print("[yellow]No repositories found.[/yellow]")
-            else:
-                table = Table(title="Your Repositories", show_lines=True)
-                table.add_column("Index", style="cyan", justify="right")
-                table.add_column("Name", style="green")
-                table.add_column("Visibility", style="magenta")
-                table.add_column("Type", style="yellow")
-                table.add_column("URL", style="blue", overflow="fold")
-                for idx, repo in enumerate(repos, start=1):
-                    table.add_row(
-                        str(idx),
-                        repo["name"],
-                        repo["visibility"],
-                        repo["repo_type"],
-                        repo["html_url"],
-                    )
-                console.print(table)
-
-        elif choice == "2":
-            # Delete (if owner) or leave (if collaborator)
-            repos = await assistant.get_repositories("all")
-            if not repos:
-                console.print("[yellow]No repositories found.[/yellow]")
-                continue
-            table = Table(title="Select a repository to delete/leave", show_lines=True)
-            table.add_column("Index", style="cyan", justify="right")
-            table.add_column("Name", style="green")
-            table.add_column("Visibility", style="magenta")
-            table.add_column("Type", style="yellow")
-            table.add_column("URL", style="blue", overflow="fold")
-            for idx, repo in enumerate(repos, start=1):
-                table.add_row(
-                    str(idx),
-                    repo["name"],
-                    repo["visibility"],
-                    repo["repo_type"],
-                    repo["html_url"],
-                )
-            console.print(table)
-            repo_index = Prompt.ask("Enter the index of the repository to delete/leave")
-            try:
-                repo_index_int = int(repo_index) - 1
-                selected_repo = repos[repo_index_int]
-            except (IndexError, ValueError):
-                console.print("[red]Invalid index selected.[/red]")
-                continue
-            if selected_repo["repo_type"] == "owner":
-                # If you are the owner – delete the repository
-                await assistant.delete_repository(selected_repo["name"])
-            else:
-                # If you are a collaborator – offer to leave the repository
-                await assistant.leave_repository(selected_repo)
-
-        elif choice == "3":
-            # Transfer repository – list only owned repositories
-            repos = await assistant.get_repositories("owner")
-            if not repos:
-                console.print("[yellow]No owned repositories found.[/yellow]")
-                continue
-            table = Table(title="Select a repository to transfer", show_lines=True)
-            table.add_column("Index", style="cyan", justify="right")
-            table.add_column("Name", style="green")
-            table.add_column("Visibility", style="magenta")
-            table.add_column("URL", style="blue", overflow="fold")
-            for idx, repo in enumerate(repos, start=1):
-                table.add_row(
-                    str(idx), repo["name"], repo["visibility"], repo["html_url"]
-                )
-            console.print(table)
-            repo_index = Prompt.ask("Enter the index of the repository to transfer")
-            try:
-                repo_index_int = int(repo_index) - 1
-                selected_repo = repos[repo_index_int]
-            except (IndexError, ValueError):
-                console.print("[red]Invalid index selected.[/red]")
-                continue
-            new_owner = Prompt.ask("Enter the new account's username")
-            new_token = Prompt.ask("Enter the new account's token", password=True)
-            delete_old_str = Prompt.ask(
-                "Delete repository from the old account after transfer? (yes/no)",
-                choices=["yes", "no"],
-                default="no",
+    # Close the assistant even when Ctrl-C cancels the menu loop
+    try:
+        while True:
+            # Load the repository listing while the user reads the menu; the menu
+            # prompts are read off the event loop so the prefetch can make progress
+            assistant.prefetch_repositories()
+            console.print("\n[bold]Menu:[/bold]")
+            console.print("1. View repositories")
+            console.print("2. Delete repository / Leave repository")
+            console.print("3. Transfer repository")
+            console.print(
+                "4. Delete duplicate repositories (compare with another account)"
             )
-            delete_old = delete_old_str.lower() == "yes"
-            await assistant.transfer_repository(
-                selected_repo["name"], new_owner, new_token, delete_old
+            console.print("5. Account statistics")
+            console.print("6. Exit")
+            choice = await _ask(
+                "Choose an action", choices=["1", "2", "3", "4", "5", "6"]
             )
 
-        elif choice == "4":
-            # Delete duplicate repositories (compare with another account)
-            other_username = Prompt.ask("Enter the other account's username")
-            other_token = Prompt.ask("Enter the other account's token", password=True)
-            exclude_input = Prompt.ask(
-                "Enter repository names to exclude (separated by spaces)", default=""
-            )
-            exclude_list = exclude_input.split() if exclude_input.strip() else []
-            await assistant.delete_duplicate_repos(
-                other_username, other_token, exclude_list
-            )
+            if choice == "1":
+                # Select filter for viewing repositories
+                console.print("\n[bold]Repository viewing options:[/bold]")
+                console.print("1. All repositories (owned and collaborated)")
+                console.print("2. Only owned repositories")
+                console.print("3. Only collaborated repositories")
+                filter_choice = await _ask("Choose an option", choices=["1", "2", "3"])
+                if filter_choice == "1":
+                    repo_filter = "all"
+                elif filter_choice == "2":
+                    repo_filter = "owner"
+                elif filter_choice == "3":
+                    repo_filter = "collaborator"
+                repos = await assistant.get_repositories(repo_filter)
+                if not repos:
+                    console.print("[yellow]No repositories found.[/yellow]")
+                else:
+                    _browse_repos(console, repos, "Your Repositories")
 
-        elif choice == "5":
-            # Account statistics
-            stats = await assistant.get_account_statistics()
-            if stats:
-                stats_table = Table(title="Account Statistics", show_lines=True)
-                stats_table.add_column("Statistic", style="cyan", justify="right")
-                stats_table.add_column("Value", style="green")
-                for key, value in stats.items():
-                    stats_table.add_row(str(key), str(value))
-                # Wrap the table in a panel for enhanced visuals
-                panel = Panel(
-                    stats_table,
-                    title="GitHub Account Stats",
-                    border_style="bright_blue",
+            elif choice == "2":
+                # Delete (if owner) or leave (if collaborator)
+                repos = await assistant.get_repositories("all")
+                if not repos:
+                    console.print("[yellow]No repositories found.[/yellow]")
+                    continue
+                selected_repo = _pick_repo(
+                    console,
+                    repos,
+                    "Select a repository to delete/leave",
+                    "delete/leave",
                 )
-                console.print(panel)
+                if selected_repo is None:
+                    continue
+                if selected_repo["repo_type"] == "owner":
+                    # If you are the owner – delete the repository
+                    await assistant.delete_repository(selected_repo["name"])
+                else:
+                    # If you are a collaborator – offer to leave the repository
+                    await assistant.leave_repository(selected_repo)
 
-        elif choice == "6":
-            console.print("[bold green]Exiting GitHub Assistant. Goodbye![/bold green]")
-            break
+            elif choice == "3":
+                # Transfer repository – list only owned repositories
+                repos = await assistant.get_repositories("owner")
+                if not repos:
+                    console.print("[yellow]No owned repositories found.[/yellow]")
+                    continue
+                selected_repo = _pick_repo(
+                    console,
+                    repos,
+                    "Select a repository to transfer",
+                    "transfer",
+                    show_type=False,
+                )
+                if selected_repo is None:
+                    continue
+                new_owner = Prompt.ask("Enter the new account's username")
+                new_token = Prompt.ask("Enter the new account's token", password=True)
+                delete_old_str = Prompt.ask(
+                    "Delete repository from the old account after transfer? (yes/no)",
+                    choices=["yes", "no"],
+                    default="no",
+                )
+                delete_old = delete_old_str.lower() == "yes"
+                await assistant.transfer_repository(
+                    selected_repo["name"], new_owner, new_token, delete_old
+                )
+
+            elif choice == "4":
+                # Delete duplicate repositories (compare with another account)
+                other_username = Prompt.ask("Enter the other account's username")
+                other_token = Prompt.ask(
+                    "Enter the other account's token", password=True
+                )
+                exclude_input = Prompt.ask(
+                    "Enter repository names to exclude (separated by spaces)",
+                    default="",
+                )
+                exclude_list = exclude_input.split() if exclude_input.strip() else []
+                await assistant.delete_duplicate_repos(
+                    other_username, other_token, exclude_list
+                )
+
+            elif choice == "5":
+                # Account statistics
+                stats = await assistant.get_account_statistics()
+                if stats:
+                    stats_table = Table(title="Account Statistics", show_lines=True)
+                    stats_table.add_column("Statistic", style="cyan", justify="right")
+                    stats_table.add_column("Value", style="green")
+                    for key, value in stats.items():
+                        stats_table.add_row(str(key), str(value))
+                    # Wrap the table in a panel for enhanced visuals
+                    panel = Panel(
+                        stats_table,
+                        title="GitHub Account Stats",
+                        border_style="bright_blue",
+                    )
+                    console.print(panel)
 
-    await assistant.close()
+            elif choice == "6":
+                console.print(
+                    "[bold green]Exiting GitHub Assistant. Goodbye![/bold green]"
+                )
+                break
+    finally:
+        await assistant.close()
 
 
 if __name__ == "__main__":